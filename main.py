@@ -8,19 +8,30 @@ Usage:
   3) Run: python main.py
 
 Notes:
-  - This bot uses Slash Commands (Application Commands). After startup, it syncs the /roll command.
+  - This bot uses Slash Commands (Application Commands). After startup, it syncs the commands if their
+    definitions changed since the last sync (tracked in .commands.sha256; delete it to force a resync).
   - Message Content Intent is not required for slash commands.
   - Invite the bot with the applications.commands scope and permission to send messages.
 """
 from __future__ import annotations
 from dotenv import load_dotenv
+import asyncio
+import concurrent.futures
+import bisect
+import difflib
+import functools
+import hashlib
+import io
 import os
 import random
 import sys
 import re
+import threading
+import time
 import sqlite3
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from typing import Optional, List, Dict, Any
 
 try:
@@ -30,51 +41,304 @@ except Exception as e:
     raise
 
 from discord import app_commands
+from discord.ext import tasks
 load_dotenv()
 
+
+def _champion_map(scores: Dict[str, int]) -> MappingProxyType:
+    """Freeze a role map, interning names so every map shares one string object per champion."""
+    return MappingProxyType({sys.intern(name): score for name, score in scores.items()})
+
+
 # Role-based champion aggression maps (2 = least aggressive, 19 = most aggressive).
-TOP_LANE_CHAMPIONS = {
+# Wrapped in read-only proxies: the bucket precompute below relies on them never changing.
+TOP_LANE_CHAMPIONS = _champion_map({
     "Aatrox": 8, "Camille": 13, "Cho'Gath": 7, "Darius": 13, "Dr. Mundo": 4, "Fiora": 11, "Garen": 4, "Gnar": 16,
     "Illaoi": 7, "Irelia": 14, "Jax": 13, "Jayce": 4, "Kayle": 3, "Kennen": 17, "Kled": 20, "Malphite": 17, "Maokai": 9,
     "Mordekaiser": 8, "Nasus": 3, "Ornn": 14, "Poppy": 10, "Quinn": 3, "Renekton": 13, "Riven": 13, "Rumble": 8,
     "Sett": 14, "Shen": 17, "Singed": 8, "Sion": 9, "Tryndamere": 7, "Urgot": 8, "Volibear": 14, "Yorick": 8,
     "Teemo": 1, "Aurora": 2, "Vayne": 3, "Kalista": 4
-}
+})
 
-SUPPORT_CHAMPIONS = {  # Typically supports in bot lane
+SUPPORT_CHAMPIONS = _champion_map({  # Typically supports in bot lane
     "Alistar": 15, "Bard": 11, "Blitzcrank": 14, "Braum": 10, "Janna": 3, "Karma": 3, "Leona": 17, "Lulu": 7, "Morgana": 13,
     "Nami": 12, "Nautilus": 16, "Pyke": 11, "Rakan": 17, "Rell": 18, "Renata Glasc": 10, "Sona": 8, "Soraka": 4,
     "Tahm Kench": 9, "Taric": 9, "Thresh": 16, "Yuumi": 2, "Zilean": 7, "Zyra": 9, "Milio": 5, "Malphite": 20, "Teemo": 1
-}
+})
 
-JUNGLE_CHAMPIONS = {
+JUNGLE_CHAMPIONS = _champion_map({
     "Amumu": 17, "Bel'Veth": 5, "Briar": 19, "Diana": 16, "Ekko": 8, "Elise": 11, "Evelynn": 8, "Fiddlesticks": 17,
     "Gragas": 12, "Graves": 4, "Hecarim": 17, "Ivern": 2, "Jarvan IV": 16, "Jax": 13, "Karthus": 8, "Kayn": 14,
     "Kindred": 2, "Kha'Zix": 14, "Lee Sin": 17, "Lillia": 13, "Maokai": 9, "Master Yi": 5, "Nidalee": 5,
     "Nocturne": 16, "Nunu & Willump": 16, "Poppy": 10, "Rammus": 10, "Rek'Sai": 9, "Rengar": 11, "Sejuani": 16,
     "Shaco": 3, "Skarner": 16, "Talon": 11, "Trundle": 8, "Udyr": 6, "Vi": 16, "Viego": 9, "Warwick": 14,
     "Wukong": 15, "Xin Zhao": 9, "Zac": 17, "Teemo": 1, "Malphite": 20
-}
+})
 
-ADC_CHAMPIONS = {
+ADC_CHAMPIONS = _champion_map({
     "Aphelios": 8, "Ashe": 18, "Caitlyn": 3, "Draven": 14, "Ezreal": 2, "Jhin": 12, "Jinx": 20, "Kai'Sa": 14,
     "Kalista": 17, "Kog'Maw": 9, "Lucian": 14, "Miss Fortune": 8, "Nilah": 16, "Samira": 18, "Senna": 4,
     "Sivir": 3, "Tristana": 16, "Twitch": 16, "Varus": 16, "Vayne": 8, "Xayah": 8, "Zeri": 15, "Teemo": 1
-}
+})
 
-MID_LANE_CHAMPIONS = {
+MID_LANE_CHAMPIONS = _champion_map({
     "Ahri": 12, "Akali": 17, "Anivia": 11, "Annie": 18, "Aurelion Sol": 11, "Azir": 17, "Cassiopeia": 14, "Corki": 2,
     "Diana": 16, "Ekko": 12, "Fizz": 17, "Galio": 14, "Irelia": 17, "Jayce": 4, "Kassadin": 12, "Katarina": 17,
     "LeBlanc": 8, "Lissandra": 14, "Lux": 6, "Malzahar": 14, "Neeko": 17, "Orianna": 14, "Qiyana": 18, "Ryze": 11,
     "Seraphine": 14, "Sylas": 16, "Syndra": 12, "Taliyah": 12, "Talon": 14, "Twisted Fate": 10, "Veigar": 11,
     "Vel'Koz": 4, "Viktor": 6, "Vladimir": 7, "Xerath": 3, "Yasuo": 17, "Yone": 17, "Zed": 18, "Ziggs": 4, "Zoe": 8,
     "Teemo": 1, "Malphite": 20
+})
+
+# Thematic lines shown for a roll, one shared tuple per bucket.
+_LABELS_NAT1 = (
+    "Chuck Norris rolled a 1 once. The dice apologized. You? You get benched...",
+    "Worst roll I’ve ever seen. Total disaster. People are laughing, believe me.",
+    "That’s not a roll, that’s a cry for help. What’re you even doing here?",
+    "You know you deserve this...",
+    "Natural one. Congratulations. You’ve managed to weaponize incompetence.",
+    "Just dodge...",
+)
+
+_LABELS_2_4 = (
+    "Be nowhere near the enemy this game...",
+    "Get down! Stay out of sight till you can pump iron. — Arnold",
+    "Your best move? Pretend you’re furniture. Nobody attacks a chair.",
+    "Walk away from danger. Keep walking. In fact, don’t stop walking.",
+    "The best fight is the one you don't take. — Bruce",
+)
+
+_LABELS_5_9 = (
+    "You get some rope this game. Don't hang yourself with it..",
+    "Light skirmishes only. If it bleeds, let your jungler kill it. — Arnold",
+)
+
+_LABELS_10_14 = (
+    "Your team is relying on you to make plays this game. Don't let them down...",
+)
+
+_LABELS_15_19 = (
+    "YOU ARE THE ENGAGE. BE THE ENGAGE.",
+    "Get to the teamfight! You start it. Hasta la vista, backline. — Arnold",
+    "Ring the bell. You lead the charge. — Stallone",
+)
+
+_LABELS_NAT20 = (
+    "The team fights when you say they fight!",
+)
+
+# Roll buckets share the same boundaries as the aggression scale: 1, 2-4, 5-9, 10-14, 15-19, 20.
+# Each entry is (low, high, thematic lines for a roll in that range).
+_BUCKETS_DATA = (
+    (1, 1, _LABELS_NAT1),
+    (2, 4, _LABELS_2_4),
+    (5, 9, _LABELS_5_9),
+    (10, 14, _LABELS_10_14),
+    (15, 19, _LABELS_15_19),
+    (20, 20, _LABELS_NAT20),
+)
+# Upper bound of every bucket but the last; bisect_left() on these yields the bucket index.
+_BUCKET_EDGES = (1, 4, 9, 14, 19)
+
+
+def _roll_color(roll_value: int) -> int:
+    """Embed color for a /roll result."""
+    if roll_value == 20:
+        return 0x00ff00  # Green for natural 20
+    elif roll_value == 1:
+        return 0xff0000  # Red for natural 1
+    elif roll_value >= 15:
+        return 0xff8c00  # Orange for high rolls
+    elif roll_value <= 5:
+        return 0x87ceeb  # Light blue for low rolls
+    return 0x7289da  # Discord blue for average rolls
+
+
+def _roll_meta(roll_value: int) -> tuple:
+    """Everything /roll derives from the die value: (bucket index, embed color, labels)."""
+    idx = bisect.bisect_left(_BUCKET_EDGES, roll_value)
+    return idx, _roll_color(roll_value), _BUCKETS_DATA[idx][2]
+
+
+# Indexed by roll value (1-20).
+_ROLL_META = (None,) + tuple(_roll_meta(v) for v in range(1, 21))
+
+# Aggression emoji and description per bucket, and the emoji expanded per score (1-20) for direct indexing.
+_BUCKET_EMOJIS = ("🛡️", "🌱", "⚖️", "⚔️", "🔥", "💥")
+_AGGR_DESCS = ("Ultra Passive", "Very Passive", "Moderate", "Aggressive", "Very Aggressive", "Ultra Aggressive")
+_AGGR_EMOJI = ("",) + tuple(_BUCKET_EMOJIS[bisect.bisect_left(_BUCKET_EDGES, a)] for a in range(1, 21))
+
+# Ten-cell progress bar and "NN%" text for every value out of 20 (roll or aggression), built once instead of per embed.
+_ROLL_BARS = tuple("█" * (v // 2) + "░" * (10 - v // 2) for v in range(21))
+_AGGR_PCT_STR = tuple(f"{(a / 20) * 100:.0f}%" for a in range(21))
+
+# Role choice -> emoji shown on /roll embeds and /champion role badges.
+_ROLE_EMOJIS = {"top": "🔝", "jungle": "🌲", "mid": "⚡", "adc": "🏹", "support": "🛡️"}
+
+# /stats embed color and footer per luck tier: very lucky, lucky, unlucky, average.
+_STATS_COLORS = (0x00ff00, 0xffff00, 0xff0000, 0x7289da)  # Green, yellow, red, Discord blue
+_STATS_FOOTERS = (
+    "🎊 You're incredibly lucky!",
+    "🍀 Lady luck is on your side!",
+    "😅 Maybe try a different dice?",
+    "🎲 Keep rolling!",
+)
+
+# /stats recent-roll emoji per die value (1-20): crits, then high and low rolls.
+_RECENT_ROLL_EMOJI = ("",) + tuple(
+    "🎉" if v == 20 else "💀" if v == 1 else "🔥" if v >= 15 else "😞" if v <= 5 else "🎲"
+    for v in range(1, 21)
+)
+
+# Bound methods of a dedicated generator keep /roll off the module-level random wrappers.
+_rng = random.Random()
+_d20 = _rng.randrange
+_pick = _rng.choice
+
+# Role choice -> champion map to draw from. Rolls without a role draw from CHAMPIONS instead.
+_ROLE_DISPATCH = {
+    "top": TOP_LANE_CHAMPIONS,
+    "jungle": JUNGLE_CHAMPIONS,
+    "adc": ADC_CHAMPIONS,
+    "mid": MID_LANE_CHAMPIONS,
+    "support": SUPPORT_CHAMPIONS,
 }
 
 
+def _index_champions() -> MappingProxyType:
+    """Build the champion-centric view of the role maps: name -> {role: aggression score}."""
+    champions = {}
+    for role_value, role_map in _ROLE_DISPATCH.items():
+        for name, score in role_map.items():
+            champions.setdefault(name, {})[role_value] = score
+    return MappingProxyType({name: MappingProxyType(scores) for name, scores in champions.items()})
+
+
+# Every champion exactly once, with its score in each role it plays (roles in _ROLE_DISPATCH order).
+CHAMPIONS = _index_champions()
+
+_ROLE_LABELS = {"top": "Top", "jungle": "Jungle", "adc": "ADC", "mid": "Mid", "support": "Support"}
+
+# Reverse indexes used by get_champion_info. A champion listed in several roles reports a single score:
+# the support score wins, then mid, adc, jungle, top (the order the original dict.update() calls applied).
+_CHAMPION_ROLES = {name: tuple(_ROLE_LABELS[r] for r in scores) for name, scores in CHAMPIONS.items()}
+_CHAMPION_AGGRESSION = {name: list(scores.values())[-1] for name, scores in CHAMPIONS.items()}
+_CHAMPION_BY_LOWER = {name.lower(): name for name in CHAMPIONS}
+
+# Every champion across all roles, for /champion's "did you mean" search and champion count.
+ALL_CHAMPIONS = frozenset(CHAMPIONS)
+TOTAL_CHAMPIONS = len(ALL_CHAMPIONS)
+# (lowercase, name) pairs in name order, so the "did you mean" search can stop at its first few hits.
+_CHAMPION_NAMES_LOWER = tuple(sorted(((name.lower(), name) for name in ALL_CHAMPIONS), key=lambda pair: pair[1]))
+_LOWER_NAMES = tuple(lower for lower, _ in _CHAMPION_NAMES_LOWER)
+
+# /champion embed color and playstyle guide per aggression bucket (see _BUCKET_EDGES).
+_BUCKET_COLORS = (
+    0x808080,  # Gray - passive
+    0x87ceeb,  # Light blue - very passive
+    0xffff00,  # Yellow - moderate
+    0xff8c00,  # Orange - aggressive
+    0xff4500,  # Red-orange - very aggressive
+    0xff0000,  # Red - ultra aggressive
+)
+_PLAYSTYLES = (
+    "🛡️ **Ultra Passive Playstyle**\n"
+    "• Avoid all fights and skirmishes\n"
+    "• Focus on farming and scaling\n"
+    "• Play defensively at all times\n"
+    "• Perfect for patient players",
+    "🌱 **Very Passive Playstyle**\n"
+    "• Farm safely and avoid unnecessary fights\n"
+    "• Only engage when you have clear advantages\n"
+    "• Focus on late-game scaling\n"
+    "• Great for defensive players",
+    "⚖️ **Balanced Playstyle**\n"
+    "• Participate in light skirmishes\n"
+    "• Look for safe opportunities\n"
+    "• Adapt to game state\n"
+    "• Versatile for all players",
+    "⚔️ **Aggressive Playstyle**\n"
+    "• Look for opportunities to make plays\n"
+    "• Control the pace of the game\n"
+    "• Take calculated risks\n"
+    "• Perfect for proactive players",
+    "🔥 **Very Aggressive Playstyle**\n"
+    "• Be the primary engage for teamfights\n"
+    "• Dictate when fights happen\n"
+    "• Create pressure and opportunities\n"
+    "• Ideal for aggressive players",
+    "💥 **Ultra Aggressive Playstyle**\n"
+    "• Dictate when fights happen\n"
+    "• Control the entire game flow\n"
+    "• Maximum pressure and aggression\n"
+    "• For fearless players only!",
+)
+
+# Champion tier by minimum aggression, highest first.
+_TIERS = (
+    (18, "🏆 **Legendary**", "Extremely rare and powerful"),
+    (15, "💎 **Epic**", "High-tier champion"),
+    (10, "⭐ **Rare**", "Above average champion"),
+    (5, "🔸 **Common**", "Standard champion"),
+    (1, "🔹 **Basic**", "Entry-level champion"),
+)
+
+# Matchup, best phase and footer for aggressive (15+), defensive (5 or less) and balanced champions.
+_STANCES = (
+    (
+        "🔥 **Counters:** Passive champions\n🛡️ **Weak to:** Disengage champions",
+        "🌅 **Early Game**\n• Strong laning phase\n• Look for early kills\n• Control objectives",
+        f"🔥 Perfect for aggressive players! • {TOTAL_CHAMPIONS} champions available",
+    ),
+    (
+        "🛡️ **Counters:** Aggressive champions\n⚔️ **Weak to:** Early game champions",
+        "🌙 **Late Game**\n• Focus on farming\n• Scale into late game\n• Teamfight oriented",
+        f"🛡️ Great for defensive players! • {TOTAL_CHAMPIONS} champions available",
+    ),
+    (
+        "⚖️ **Counters:** Extreme playstyles\n🎯 **Weak to:** Specialized champions",
+        "🌞 **Mid Game**\n• Balanced approach\n• Adapt to game state\n• Flexible timing",
+        f"⚖️ Balanced for all playstyles! • {TOTAL_CHAMPIONS} champions available",
+    ),
+)
+
+
+def _champion_aggr_text(aggression: int) -> tuple:
+    """Everything /champion derives from an aggression score: (color, tier, tier_desc, playstyle, matchup, phase, footer)."""
+    bucket = bisect.bisect_left(_BUCKET_EDGES, aggression)
+    tier, tier_desc = next((t, d) for low, t, d in _TIERS if aggression >= low)
+    stance = 0 if aggression >= 15 else 1 if aggression <= 5 else 2
+    return (_BUCKET_COLORS[bucket], tier, tier_desc, _PLAYSTYLES[bucket]) + _STANCES[stance]
+
+
+# Indexed by aggression score (1-20).
+_CHAMPION_AGGR_INFO = (None,) + tuple(_champion_aggr_text(a) for a in range(1, 21))
+
+
+def _precompute_buckets() -> Dict[tuple, tuple]:
+    """Map every (role, bucket index) pair to the sorted champion names whose score falls in that bucket."""
+    precomputed = {}
+    for idx, (low, high, _) in enumerate(_BUCKETS_DATA):
+        for role_value, role_map in _ROLE_DISPATCH.items():
+            names = [name for name, score in role_map.items() if low <= score <= high]
+            precomputed[(role_value, idx)] = tuple(sorted(names))
+        # Without a role, a champion qualifies if any of its roles falls in the bucket
+        names = [name for name, scores in CHAMPIONS.items() if any(low <= s <= high for s in scores.values())]
+        precomputed[(None, idx)] = tuple(sorted(names))
+    return precomputed
+
+
+# The champion maps never change at runtime, so resolve every candidate list once at import.
+_PRECOMPUTED = _precompute_buckets()
+
+
+_TOKEN_RE = re.compile(r'^[A-Za-z0-9_\-]{20,}\.[A-Za-z0-9_\-]{5,}\.[A-Za-z0-9_\-]{10,}$')
+# Deletes every ASCII character that isn't a letter; used to derive icon filenames from display names.
+_NON_ALPHA_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isalpha()))
+
+
 def _is_likely_discord_token(s: str) -> bool:
-    pattern = r'^[A-Za-z0-9_\-]{20,}\.[A-Za-z0-9_\-]{5,}\.[A-Za-z0-9_\-]{10,}$'
-    return re.match(pattern, s) is not None
+    return _TOKEN_RE.match(s) is not None
 
 
 def get_token() -> str:
@@ -110,7 +374,16 @@ intents = discord.Intents.default()
 # Not required for slash commands, but harmless if left enabled
 intents.message_content = False
 
-client = discord.Client(intents=intents)
+
+class RollBotClient(discord.Client):
+    async def setup_hook(self) -> None:
+        # Runs once before connecting to the gateway, unlike on_ready which fires again on every reconnect
+        init_database()
+        self.log_task = asyncio.create_task(_log_worker())
+        _refresh_leaderboards.start()
+
+
+client = RollBotClient(intents=intents)
 
 tree = app_commands.CommandTree(client)
 
@@ -140,61 +413,221 @@ _ICON_OVERRIDES = {
     # Aurelion Sol stored without space
     "Aurelion Sol": "AurelionSol.png",
 }
+_ICON_OVERRIDES = {sys.intern(name): sys.intern(fname) for name, fname in _ICON_OVERRIDES.items()}
 
 CHAMPION_ICONS_DIR = os.path.join(os.path.dirname(__file__), 'champion_icons')
+
+
+def _read_icon_files() -> Dict[str, bytes]:
+    """Read every regular file in the icon directory into memory, keyed by filename."""
+    icons = {}
+    if not os.path.isdir(CHAMPION_ICONS_DIR):
+        return icons
+    with os.scandir(CHAMPION_ICONS_DIR) as entries:
+        for entry in entries:
+            if entry.is_file():
+                with open(entry.path, 'rb') as f:
+                    icons[entry.name] = f.read()
+    return icons
+
+
+# Icon filename -> bytes, loaded once at import (a few MB) so sending an icon never touches the disk.
+_ICON_BYTES = _read_icon_files()
+# Icon lookups then become in-memory membership checks.
+_ICON_FILES = frozenset(_ICON_BYTES)
+
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), 'bot_data.db')
+# Hash of the last command manifest pushed to Discord; lets startup skip redundant syncs.
+COMMANDS_HASH_PATH = os.path.join(os.path.dirname(__file__), '.commands.sha256')
+
+# Let SQLite memory-map up to this much of the database file, so read scans skip a copy into its page cache.
+_DB_MMAP_SIZE = 256 * 1024 * 1024
+
+# The single write connection, shared by schema setup and the roll writer. init_database opens it,
+# so importing this module doesn't create or lock the database file.
+# check_same_thread=False allows use from worker threads, so every access must hold _DB_LOCK.
+_DB: Optional[sqlite3.Connection] = None
+_DB_LOCK = threading.Lock()
+
+
+def _open_write_db() -> sqlite3.Connection:
+    """Open the write connection with its connection-level PRAGMAs."""
+    # Autocommit mode (isolation_level=None) commits each statement without an explicit commit();
+    # WAL with synchronous=NORMAL avoids an fsync on every insert and lets readers run alongside writes.
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA mmap_size={_DB_MMAP_SIZE}")
+    return conn
+
+# Reads use their own connection per thread, so they never wait on _DB_LOCK or the writer;
+# WAL lets them proceed while a write is in progress.
+_READ_LOCAL = threading.local()
+
+
+def _read_db() -> sqlite3.Connection:
+    """Return this thread's read-only connection, opening it on first use."""
+    conn = getattr(_READ_LOCAL, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DATABASE_PATH, isolation_level=None)
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA mmap_size={_DB_MMAP_SIZE}")
+        _READ_LOCAL.conn = conn
+    return conn
+
+
+# Blocking database work runs off the event loop: a single thread for writes, since SQLite allows
+# one writer at a time, and a small pool for reads.
+_DB_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-write")
+_DB_READ_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="db-read")
+
+
+async def _run_read(func, *args):
+    """Run a blocking read on the read pool and return its result."""
+    return await asyncio.get_running_loop().run_in_executor(_DB_READ_EXEC, func, *args)
+
+
+# Schema, indexes, summary table and trigger, applied by init_database in one transaction that it commits
+# itself after the optional user_stats backfill below.
+# Connection-level PRAGMAs are set once when _DB is opened, since journal_mode can't change mid-transaction.
+_SCHEMA_SQL = '''
+BEGIN IMMEDIATE;
+
+CREATE TABLE IF NOT EXISTS rolls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    username TEXT NOT NULL,
+    roll_value INTEGER NOT NULL,
+    role TEXT,
+    champion TEXT,
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Recent rolls per user, plus the time-windowed leaderboards; per-user counts come from user_stats,
+-- so the old (user_id, roll_value) index is dropped from existing databases
+DROP INDEX IF EXISTS idx_rolls_user_value;
+CREATE INDEX IF NOT EXISTS idx_rolls_user_ts ON rolls(user_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_rolls_ts ON rolls(timestamp);
+
+-- Running per-user totals, so stats don't have to aggregate the whole roll history
+CREATE TABLE IF NOT EXISTS user_stats (
+    user_id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL,
+    total_rolls INTEGER NOT NULL,
+    natural_20s INTEGER NOT NULL,
+    natural_1s INTEGER NOT NULL,
+    roll_sum INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_rolls_user_stats AFTER INSERT ON rolls
+BEGIN
+    INSERT INTO user_stats (user_id, username, total_rolls, natural_20s, natural_1s, roll_sum)
+    VALUES (NEW.user_id, NEW.username, 1, NEW.roll_value = 20, NEW.roll_value = 1, NEW.roll_value)
+    ON CONFLICT(user_id) DO UPDATE SET
+        username = excluded.username,
+        total_rolls = total_rolls + 1,
+        natural_20s = natural_20s + excluded.natural_20s,
+        natural_1s = natural_1s + excluded.natural_1s,
+        roll_sum = roll_sum + excluded.roll_sum;
+END;
+'''
+
+# Fill user_stats from rolls that predate it; the latest username per user comes along with MAX(id).
+_BACKFILL_USER_STATS_SQL = '''
+INSERT INTO user_stats (user_id, username, total_rolls, natural_20s, natural_1s, roll_sum)
+SELECT user_id, username, total_rolls, natural_20s, natural_1s, roll_sum
+FROM (
+    SELECT user_id, username, MAX(id),
+           COUNT(*) as total_rolls,
+           SUM(roll_value = 20) as natural_20s,
+           SUM(roll_value = 1) as natural_1s,
+           SUM(roll_value) as roll_sum
+    FROM rolls
+    GROUP BY user_id
+)
+'''
 
 # Initialize database
 def init_database():
     """Initialize the SQLite database for storing roll statistics."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    # Create rolls table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS rolls (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            username TEXT NOT NULL,
-            roll_value INTEGER NOT NULL,
-            role TEXT,
-            champion TEXT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    conn.commit()
-    conn.close()
+    global _DB
+    with _DB_LOCK:
+        if _DB is None:
+            _DB = _open_write_db()
+        try:
+            _DB.executescript(_SCHEMA_SQL)
+            # Only backfill while user_stats is empty; once it has rows the trigger keeps it current,
+            # so later startups don't aggregate the whole roll history under the write lock
+            if _DB.execute("SELECT 1 FROM user_stats LIMIT 1").fetchone() is None:
+                _DB.execute(_BACKFILL_USER_STATS_SQL)
+            _DB.execute("COMMIT")
+        except sqlite3.Error:
+            if _DB.in_transaction:
+                _DB.execute("ROLLBACK")
+            raise
+
+# Rolls waiting to be written by _log_worker, as (user_id, username, roll_value, role, champion) tuples.
+_log_queue: asyncio.Queue = asyncio.Queue()
+_LOG_BATCH_SIZE = 100
+_LOG_FLUSH_INTERVAL = 0.2  # seconds to keep collecting after the first queued roll
 
 def log_roll(user_id: int, username: str, roll_value: int, role: Optional[str], champion: Optional[str]):
-    """Log a roll to the database."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        INSERT INTO rolls (user_id, username, roll_value, role, champion)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (user_id, username, roll_value, role, champion))
-    
-    conn.commit()
-    conn.close()
+    """Queue a roll to be written to the database by the background writer."""
+    _log_queue.put_nowait((user_id, username, roll_value, role, champion))
+
+def _write_rolls(batch: List[tuple]):
+    """Insert a batch of queued rolls in a single transaction."""
+    with _DB_LOCK:
+        _DB.execute('BEGIN')
+        try:
+            _DB.executemany('''
+                INSERT INTO rolls (user_id, username, roll_value, role, champion)
+                VALUES (?, ?, ?, ?, ?)
+            ''', batch)
+            _DB.execute('COMMIT')
+        except Exception:
+            # A failed COMMIT can leave the transaction open; close it so the next batch can BEGIN
+            if _DB.in_transaction:
+                _DB.execute('ROLLBACK')
+            raise
+
+async def _log_worker():
+    """Drain the roll queue, writing up to _LOG_BATCH_SIZE rolls per transaction."""
+    loop = asyncio.get_running_loop()
+    batch = []
+    try:
+        while True:
+            batch.append(await _log_queue.get())
+            deadline = loop.time() + _LOG_FLUSH_INTERVAL
+            while len(batch) < _LOG_BATCH_SIZE:
+                try:
+                    batch.append(await asyncio.wait_for(_log_queue.get(), deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+            # Hand the batch off before awaiting, so a cancellation mid-write doesn't flush it twice
+            pending, batch = batch, []
+            try:
+                await loop.run_in_executor(_DB_EXEC, _write_rolls, pending)
+            except Exception as e:
+                # Drop the batch but keep the writer alive, or the queue would grow with nothing draining it
+                print(f"WARNING: Failed to log {len(pending)} roll(s):", e, file=sys.stderr)
+    except asyncio.CancelledError:
+        # Shutting down: flush everything still pending so no rolls are lost
+        while not _log_queue.empty():
+            batch.append(_log_queue.get_nowait())
+        if batch:
+            _write_rolls(batch)
+        raise
 
 def get_user_stats(user_id: int) -> Dict[str, Any]:
     """Get roll statistics for a specific user."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    # Get total rolls
-    cursor.execute('SELECT COUNT(*) FROM rolls WHERE user_id = ?', (user_id,))
-    total_rolls = cursor.fetchone()[0]
-    
-    # Get natural 20s
-    cursor.execute('SELECT COUNT(*) FROM rolls WHERE user_id = ? AND roll_value = 20', (user_id,))
-    natural_20s = cursor.fetchone()[0]
+    cursor = _read_db().cursor()
     
-    # Get natural 1s
-    cursor.execute('SELECT COUNT(*) FROM rolls WHERE user_id = ? AND roll_value = 1', (user_id,))
-    natural_1s = cursor.fetchone()[0]
+    # Get totals from the running summary
+    cursor.execute('SELECT total_rolls, natural_20s, natural_1s FROM user_stats WHERE user_id = ?', (user_id,))
+    total_rolls, natural_20s, natural_1s = cursor.fetchone() or (0, 0, 0)
     
     # Get recent rolls (last 10)
     cursor.execute('''
@@ -206,8 +639,6 @@ def get_user_stats(user_id: int) -> Dict[str, Any]:
     ''', (user_id,))
     recent_rolls = cursor.fetchall()
     
-    conn.close()
-    
     return {
         'total_rolls': total_rolls,
         'natural_20s': natural_20s,
@@ -215,236 +646,192 @@ def get_user_stats(user_id: int) -> Dict[str, Any]:
         'recent_rolls': recent_rolls
     }
 
-def get_leaderboard_data(category: str, limit: int = 10) -> List[Dict[str, Any]]:
-    """Get leaderboard data for a specific category."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    if category == "total_rolls":
-        cursor.execute('''
-            SELECT user_id, username, COUNT(*) as count
-            FROM rolls 
-            GROUP BY user_id, username 
-            ORDER BY count DESC 
-            LIMIT ?
-        ''', (limit,))
-    elif category == "natural_20s":
-        cursor.execute('''
-            SELECT user_id, username, COUNT(*) as count
-            FROM rolls 
-            WHERE roll_value = 20
-            GROUP BY user_id, username 
-            ORDER BY count DESC 
-            LIMIT ?
-        ''', (limit,))
-    elif category == "natural_1s":
-        cursor.execute('''
-            SELECT user_id, username, COUNT(*) as count
-            FROM rolls 
-            WHERE roll_value = 1
-            GROUP BY user_id, username 
-            ORDER BY count DESC 
-            LIMIT ?
-        ''', (limit,))
-    elif category == "luckiest":
-        cursor.execute('''
-            SELECT user_id, username, 
-                   COUNT(CASE WHEN roll_value = 20 THEN 1 END) as nat_20s,
-                   COUNT(*) as total_rolls,
-                   ROUND(COUNT(CASE WHEN roll_value = 20 THEN 1 END) * 100.0 / COUNT(*), 2) as luck_percentage
+# Leaderboard SQL per category; every query takes the row limit as its only parameter.
+# All-time categories read the per-user running totals in user_stats; the time-windowed ones have to
+# count the matching rows in rolls (served by idx_rolls_ts). Every board has one row per user_id under
+# their latest username: user_stats keeps it current, and MAX(id) makes SQLite take the bare username
+# column from each user's newest roll in the window.
+_LEADERBOARD_QUERIES = {
+    "total_rolls": '''
+        SELECT user_id, username, total_rolls as count
+        FROM user_stats 
+        ORDER BY count DESC 
+        LIMIT ?
+    ''',
+    "natural_20s": '''
+        SELECT user_id, username, natural_20s as count
+        FROM user_stats 
+        WHERE natural_20s > 0
+        ORDER BY count DESC 
+        LIMIT ?
+    ''',
+    "natural_1s": '''
+        SELECT user_id, username, natural_1s as count
+        FROM user_stats 
+        WHERE natural_1s > 0
+        ORDER BY count DESC 
+        LIMIT ?
+    ''',
+    "luckiest": '''
+        SELECT user_id, username, 
+               natural_20s as nat_20s,
+               total_rolls,
+               ROUND(natural_20s * 100.0 / total_rolls, 2) as luck_percentage
+        FROM user_stats 
+        WHERE total_rolls >= 5
+        ORDER BY luck_percentage DESC, nat_20s DESC
+        LIMIT ?
+    ''',
+    "unluckiest": '''
+        SELECT user_id, username, 
+               natural_1s as nat_1s,
+               total_rolls,
+               ROUND(natural_1s * 100.0 / total_rolls, 2) as unluck_percentage
+        FROM user_stats 
+        WHERE total_rolls >= 5
+        ORDER BY unluck_percentage DESC, nat_1s DESC
+        LIMIT ?
+    ''',
+    "highest_avg": '''
+        SELECT user_id, username, 
+               ROUND(roll_sum * 1.0 / total_rolls, 2) as avg_roll,
+               total_rolls
+        FROM user_stats 
+        WHERE total_rolls >= 5
+        ORDER BY avg_roll DESC, total_rolls DESC
+        LIMIT ?
+    ''',
+    "most_active_today": '''
+        SELECT user_id, username, count
+        FROM (
+            SELECT user_id, username, MAX(id), COUNT(*) as count
             FROM rolls 
-            GROUP BY user_id, username 
-            HAVING total_rolls >= 5
-            ORDER BY luck_percentage DESC, nat_20s DESC
-            LIMIT ?
-        ''', (limit,))
-    elif category == "unluckiest":
-        cursor.execute('''
-            SELECT user_id, username, 
-                   COUNT(CASE WHEN roll_value = 1 THEN 1 END) as nat_1s,
-                   COUNT(*) as total_rolls,
-                   ROUND(COUNT(CASE WHEN roll_value = 1 THEN 1 END) * 100.0 / COUNT(*), 2) as unluck_percentage
-            FROM rolls 
-            GROUP BY user_id, username 
-            HAVING total_rolls >= 5
-            ORDER BY unluck_percentage DESC, nat_1s DESC
-            LIMIT ?
-        ''', (limit,))
-    elif category == "highest_avg":
-        cursor.execute('''
-            SELECT user_id, username, 
-                   ROUND(AVG(roll_value), 2) as avg_roll,
-                   COUNT(*) as total_rolls
-            FROM rolls 
-            GROUP BY user_id, username 
-            HAVING total_rolls >= 5
-            ORDER BY avg_roll DESC, total_rolls DESC
-            LIMIT ?
-        ''', (limit,))
-    elif category == "most_active_today":
-        cursor.execute('''
-            SELECT user_id, username, COUNT(*) as count
-            FROM rolls 
-            WHERE DATE(timestamp) = DATE('now')
-            GROUP BY user_id, username 
-            ORDER BY count DESC 
-            LIMIT ?
-        ''', (limit,))
-    elif category == "most_active_week":
-        cursor.execute('''
-            SELECT user_id, username, COUNT(*) as count
+            WHERE timestamp >= DATE('now') AND timestamp < DATE('now', '+1 day')
+            GROUP BY user_id
+        )
+        ORDER BY count DESC 
+        LIMIT ?
+    ''',
+    "most_active_week": '''
+        SELECT user_id, username, count
+        FROM (
+            SELECT user_id, username, MAX(id), COUNT(*) as count
             FROM rolls 
-            WHERE timestamp >= datetime('now', '-7 days')
-            GROUP BY user_id, username 
-            ORDER BY count DESC 
-            LIMIT ?
-        ''', (limit,))
-    else:
-        conn.close()
+            WHERE timestamp >= datetime('now', '-7 days') AND timestamp <= datetime('now')
+            GROUP BY user_id
+        )
+        ORDER BY count DESC 
+        LIMIT ?
+    ''',
+}
+
+# Rank-lookup SQL per category; every query takes the user id as its only parameter.
+_USER_RANK_QUERIES = {
+    "total_rolls": '''
+        SELECT COUNT(*) + 1 as rank
+        FROM user_stats
+        WHERE total_rolls > COALESCE((SELECT total_rolls FROM user_stats WHERE user_id = ?), 0)
+    ''',
+    "natural_20s": '''
+        SELECT COUNT(*) + 1 as rank
+        FROM user_stats
+        WHERE natural_20s > COALESCE((SELECT natural_20s FROM user_stats WHERE user_id = ?), 0)
+    ''',
+    "luckiest": '''
+        SELECT COUNT(*) + 1 as rank
+        FROM user_stats
+        WHERE total_rolls >= 5 AND ROUND(natural_20s * 100.0 / total_rolls, 2) > (
+            SELECT ROUND(natural_20s * 100.0 / total_rolls, 2)
+            FROM user_stats 
+            WHERE user_id = ?
+        )
+    ''',
+}
+
+def get_leaderboard_data(category: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Get leaderboard data for a specific category."""
+    sql = _LEADERBOARD_QUERIES.get(category)
+    if sql is None:
         return []
     
-    results = cursor.fetchall()
-    conn.close()
-    
-    # Convert to list of dictionaries
-    leaderboard = []
-    for i, (user_id, username, *data) in enumerate(results, 1):
-        entry = {
-            'rank': i,
-            'user_id': user_id,
-            'username': username,
-            'data': data
-        }
-        leaderboard.append(entry)
+    results = _read_db().execute(sql, (limit,)).fetchall()
     
-    return leaderboard
+    # Convert to list of dictionaries; rows are tuples, so data is a cheap slice
+    return [
+        {'rank': i, 'user_id': row[0], 'username': row[1], 'data': row[2:]}
+        for i, row in enumerate(results, 1)
+    ]
 
 def get_user_rank(user_id: int, category: str) -> Optional[Dict[str, Any]]:
     """Get a user's rank in a specific category."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    if category == "total_rolls":
-        cursor.execute('''
-            SELECT COUNT(*) + 1 as rank
-            FROM (
-                SELECT user_id, COUNT(*) as count
-                FROM rolls 
-                GROUP BY user_id
-                HAVING count > (
-                    SELECT COUNT(*) 
-                    FROM rolls 
-                    WHERE user_id = ?
-                )
-            )
-        ''', (user_id,))
-    elif category == "natural_20s":
-        cursor.execute('''
-            SELECT COUNT(*) + 1 as rank
-            FROM (
-                SELECT user_id, COUNT(*) as count
-                FROM rolls 
-                WHERE roll_value = 20
-                GROUP BY user_id
-                HAVING count > (
-                    SELECT COUNT(*) 
-                    FROM rolls 
-                    WHERE user_id = ? AND roll_value = 20
-                )
-            )
-        ''', (user_id,))
-    elif category == "luckiest":
-        cursor.execute('''
-            SELECT COUNT(*) + 1 as rank
-            FROM (
-                SELECT user_id, 
-                       ROUND(COUNT(CASE WHEN roll_value = 20 THEN 1 END) * 100.0 / COUNT(*), 2) as luck_percentage
-                FROM rolls 
-                GROUP BY user_id
-                HAVING COUNT(*) >= 5 AND luck_percentage > (
-                    SELECT ROUND(COUNT(CASE WHEN roll_value = 20 THEN 1 END) * 100.0 / COUNT(*), 2)
-                    FROM rolls 
-                    WHERE user_id = ?
-                )
-            )
-        ''', (user_id,))
-    else:
-        conn.close()
+    sql = _USER_RANK_QUERIES.get(category)
+    if sql is None:
         return None
     
-    result = cursor.fetchone()
-    conn.close()
+    result = _read_db().execute(sql, (user_id,)).fetchone()
     
     if result:
         return {'rank': result[0]}
     return None
 
-def get_champion_info(champion_name: str) -> Optional[Dict[str, Any]]:
-    """Get comprehensive information about a champion."""
-    # Search for champion in all role dictionaries
-    all_champions = {}
-    all_champions.update(TOP_LANE_CHAMPIONS)
-    all_champions.update(JUNGLE_CHAMPIONS)
-    all_champions.update(ADC_CHAMPIONS)
-    all_champions.update(MID_LANE_CHAMPIONS)
-    all_champions.update(SUPPORT_CHAMPIONS)
-    
-    # Find champion (case-insensitive)
-    champion_key = None
-    for key in all_champions.keys():
-        if key.lower() == champion_name.lower():
-            champion_key = key
-            break
-    
-    if not champion_key:
-        return None
-    
-    aggression = all_champions[champion_key]
-    
-    # Determine roles
-    roles = []
-    if champion_key in TOP_LANE_CHAMPIONS:
-        roles.append("Top")
-    if champion_key in JUNGLE_CHAMPIONS:
-        roles.append("Jungle")
-    if champion_key in ADC_CHAMPIONS:
-        roles.append("ADC")
-    if champion_key in MID_LANE_CHAMPIONS:
-        roles.append("Mid")
-    if champion_key in SUPPORT_CHAMPIONS:
-        roles.append("Support")
-    
-    # Determine aggression level description
-    if aggression == 1:
-        aggression_desc = "Ultra Passive"
-    elif 2 <= aggression <= 4:
-        aggression_desc = "Very Passive"
-    elif 5 <= aggression <= 9:
-        aggression_desc = "Moderate"
-    elif 10 <= aggression <= 14:
-        aggression_desc = "Aggressive"
-    elif 15 <= aggression <= 19:
-        aggression_desc = "Very Aggressive"
-    else:  # aggression == 20
-        aggression_desc = "Ultra Aggressive"
-    
-    return {
-        'name': champion_key,
-        'aggression': aggression,
-        'aggression_desc': aggression_desc,
-        'roles': roles,
-        'icon_path': get_icon_path_for_champion(champion_key)
-    }
+# Recently computed ranks, so repeated /leaderboard clicks skip the rank SQL; the leaderboards themselves
+# are cached in LB_SNAPSHOT. The per-user rank cache is cleared when it fills.
+_RANK_TTL = 15  # seconds; a user's own rank moves with every roll they make
+_RANK_CACHE_MAX = 1024
+_RANK_CACHE: Dict[tuple, tuple] = {}
 
+def get_user_rank_cached(user_id: int, category: str) -> Optional[Dict[str, Any]]:
+    """get_user_rank, reusing a result computed within the last _RANK_TTL seconds."""
+    key = (user_id, category)
+    now = time.monotonic()
+    hit = _RANK_CACHE.get(key)
+    if hit is not None and now - hit[0] < _RANK_TTL:
+        return hit[1]
+    rank = get_user_rank(user_id, category)
+    if len(_RANK_CACHE) >= _RANK_CACHE_MAX:
+        _RANK_CACHE.clear()
+    _RANK_CACHE[key] = (now, rank)
+    return rank
+
+# Every leaderboard at the largest allowed limit, rebuilt in the background; /leaderboard slices these.
+LB_SNAPSHOT_LIMIT = 25
+LB_SNAPSHOT: Dict[str, List[Dict[str, Any]]] = {}
+# When each category's snapshot was computed, shown as the embed timestamp ("data as of").
+LB_SNAPSHOT_TS: Dict[str, datetime] = {}
+
+@tasks.loop(minutes=5)
+async def _refresh_leaderboards():
+    """Recompute every leaderboard category into LB_SNAPSHOT."""
+    for category in _LEADERBOARD_QUERIES:
+        try:
+            LB_SNAPSHOT[category] = await _run_read(get_leaderboard_data, category, LB_SNAPSHOT_LIMIT)
+            LB_SNAPSHOT_TS[category] = datetime.now(timezone.utc)
+        except sqlite3.Error as e:
+            print(f"WARNING: Failed to refresh {category} leaderboard:", e, file=sys.stderr)
+
+def find_similar_champions(query: str, limit: int = 5) -> List[str]:
+    """Champion names containing (or contained in) the query, falling back to close spellings."""
+    query = query.lower()
+    similar = []
+    for champ_lower, champ in _CHAMPION_NAMES_LOWER:
+        if query in champ_lower or champ_lower in query:
+            similar.append(champ)
+            if len(similar) == limit:
+                break
+    if not similar:
+        # No substring hit, so likely a typo: suggest the closest spellings instead
+        similar = [_CHAMPION_BY_LOWER[m] for m in difflib.get_close_matches(query, _LOWER_NAMES, n=limit)]
+    return similar
+
+@functools.lru_cache(maxsize=512)
 def _default_icon_filename(name: str) -> str:
-    # Remove non-letter characters and join parts to form PascalCase-like filename.
-    parts = re.split(r"[^A-Za-z]+", name)
-    joined = "".join(parts)
-    return f"{joined}.png"
+    # Remove non-letter characters to form PascalCase-like filename.
+    return f"{name.translate(_NON_ALPHA_TABLE)}.png"
 
 
-def get_icon_path_for_champion(name: str) -> str | None:
-    """Return the full path to the icon for the given champion name, if it exists."""
+@functools.lru_cache(maxsize=512)
+def _icon_filename_for_champion(name: str) -> str | None:
+    """Return the icon's filename in champion_icons (also its _ICON_BYTES key), if it exists."""
     # First try overrides
     fname = _ICON_OVERRIDES.get(name)
     candidates = []
@@ -456,19 +843,46 @@ def get_icon_path_for_champion(name: str) -> str | None:
     if not fname:
         # Try making internal capitalization looser for odd cases like Velkoz (already covered), Belveth etc.
         candidates.append(_default_icon_filename(name).replace("'", "").replace(" ", ""))
-    # Ensure uniqueness
-    seen = set()
-    uniq_candidates = []
-    for c in candidates:
-        if c not in seen:
-            uniq_candidates.append(c)
-            seen.add(c)
-    for filename in uniq_candidates:
-        full = os.path.join(CHAMPION_ICONS_DIR, filename)
-        if os.path.isfile(full):
-            return full
+    # Ensure uniqueness while keeping priority order
+    for filename in dict.fromkeys(candidates):
+        if filename in _ICON_FILES:
+            return filename
     return None
 
+
+def get_icon_path_for_champion(name: str) -> str | None:
+    """Return the full path to the icon for the given champion name, if it exists."""
+    filename = _icon_filename_for_champion(name)
+    return os.path.join(CHAMPION_ICONS_DIR, filename) if filename else None
+
+
+# Everything get_champion_info reports, built once per champion and keyed by lowercase name,
+# so lookups from /roll and /champion are a single dict hit with no per-call dict building.
+_CHAMPION_INFO = {
+    name.lower(): MappingProxyType({
+        'name': name,
+        'aggression': _CHAMPION_AGGRESSION[name],
+        'aggression_desc': _AGGR_DESCS[bisect.bisect_left(_BUCKET_EDGES, _CHAMPION_AGGRESSION[name])],
+        'roles': _CHAMPION_ROLES[name],
+        'role_badges_str': "\n".join(f"{_ROLE_EMOJIS[r]} **{_ROLE_LABELS[r]}**" for r in CHAMPIONS[name]),
+        'icon_file': _icon_filename_for_champion(name),
+        'icon_path': get_icon_path_for_champion(name),
+    })
+    for name in CHAMPIONS
+}
+
+
+def get_champion_info(champion_name: str) -> Optional[MappingProxyType]:
+    """Get comprehensive information about a champion (case-insensitive)."""
+    return _CHAMPION_INFO.get(champion_name.lower())
+
+
+def _icon_file(icon_name: Optional[str]) -> Optional[discord.File]:
+    """Build an attachment from the in-memory icon cache, given a champion's 'icon_file' (None if it has no icon)."""
+    if icon_name is None:
+        return None
+    return discord.File(io.BytesIO(_ICON_BYTES[icon_name]), filename="champion.png")
+
 @tree.command(name="roll", description="Roll a d20 and return champions matching the same aggression range.")
 @app_commands.describe(role="Optional: pick a lane/role")
 @app_commands.choices(role=[
@@ -479,107 +893,34 @@ def get_icon_path_for_champion(name: str) -> str | None:
     app_commands.Choice(name="mid", value="mid"),
 ])
 async def roll(interaction: discord.Interaction, role: app_commands.Choice[str] | None = None):
-    roll_value = random.randint(1, 20)
-
-    # Determine the bucket for the rolled value and pick a thematic line
-    if roll_value == 1:
-        low, high = 1, 1
-        labels = [
-            "Chuck Norris rolled a 1 once. The dice apologized. You? You get benched...",
-            "Worst roll I’ve ever seen. Total disaster. People are laughing, believe me.",
-            "That’s not a roll, that’s a cry for help. What’re you even doing here?",
-            "You know you deserve this...",
-            "Natural one. Congratulations. You’ve managed to weaponize incompetence.",
-            "Just dodge..."
-        ]
-    elif 2 <= roll_value <= 4:
-        low, high = 2, 4
-        labels = [
-            "Be nowhere near the enemy this game...",
-            "Get down! Stay out of sight till you can pump iron. — Arnold",
-            "Your best move? Pretend you’re furniture. Nobody attacks a chair.",
-            "Walk away from danger. Keep walking. In fact, don’t stop walking.",
-            "The best fight is the one you don't take. — Bruce"
-        ]
-    elif 5 <= roll_value <= 9:
-        low, high = 5, 9
-        labels = [
-            "You get some rope this game. Don't hang yourself with it..",
-            "Light skirmishes only. If it bleeds, let your jungler kill it. — Arnold"
-        ]
-    elif 10 <= roll_value <= 14:
-        low, high = 10, 14
-        labels = [
-            "Your team is relying on you to make plays this game. Don't let them down...",
-        ]
-    elif 15 <= roll_value <= 19:
-        low, high = 15, 19
-        labels = [
-            "YOU ARE THE ENGAGE. BE THE ENGAGE.",
-            "Get to the teamfight! You start it. Hasta la vista, backline. — Arnold",
-            "Ring the bell. You lead the charge. — Stallone"
-        ]
-    else:  # roll_value == 20
-        low, high = 20, 20
-        labels = [
-            "The team fights when you say they fight!"
-        ]
-    label = random.choice(labels)
-
-    # Choose the relevant maps based on the role argument
+    # Acknowledge within Discord's 3-second window before touching the database or icon files
+    await interaction.response.defer()
+
+    roll_value = _d20(1, 21)
+
+    # Determine the bucket, embed color and thematic line for the rolled value
+    bucket_idx, color, labels = _ROLL_META[roll_value]
+    label = _pick(labels)
+
+    # Look up the champions whose aggression score falls within the bucket
     role_value = role.value if role is not None else None
-    maps = []
-    scope = "all roles"
-    if role_value is None:
-        maps = [TOP_LANE_CHAMPIONS, JUNGLE_CHAMPIONS, ADC_CHAMPIONS, MID_LANE_CHAMPIONS, SUPPORT_CHAMPIONS]
-    else:
-        scope = role_value
-        if role_value == "top":
-            maps = [TOP_LANE_CHAMPIONS]
-        elif role_value == "jungle":
-            maps = [JUNGLE_CHAMPIONS]
-        elif role_value == "adc":
-            maps = [ADC_CHAMPIONS]
-        elif role_value == "mid":
-            maps = [MID_LANE_CHAMPIONS]
-        elif role_value == "support":
-            maps = [SUPPORT_CHAMPIONS]
-        else:
-            maps = [TOP_LANE_CHAMPIONS, JUNGLE_CHAMPIONS, ADC_CHAMPIONS, MID_LANE_CHAMPIONS, SUPPORT_CHAMPIONS]
-            scope = "all roles"
-
-    # Gather all champions whose aggression score falls within the bucket
-    names = set()
-    for m in maps:
-        for name, score in m.items():
-            if low <= score <= high:
-                names.add(name)
-
-    names_list = sorted(names)
-    if names_list:
-        picked = random.choice(names_list)
-        
-        # Log the roll to database
-        log_roll(
-            user_id=interaction.user.id,
-            username=interaction.user.display_name,
-            roll_value=roll_value,
-            role=role_value,
-            champion=picked
-        )
-        
-        # Determine embed color based on roll value
-        if roll_value == 20:
-            color = 0x00ff00  # Green for natural 20
-        elif roll_value == 1:
-            color = 0xff0000  # Red for natural 1
-        elif roll_value >= 15:
-            color = 0xff8c00  # Orange for high rolls
-        elif roll_value <= 5:
-            color = 0x87ceeb  # Light blue for low rolls
-        else:
-            color = 0x7289da  # Discord blue for average rolls
-        
+    role_key = role_value if role_value in _ROLE_DISPATCH else None
+    scope = role_key or "all roles"
+    names_list = _PRECOMPUTED[(role_key, bucket_idx)]
+
+    picked = _pick(names_list) if names_list else None
+
+    # Log the roll to database, even if no champion was found
+    log_roll(
+        user_id=interaction.user.id,
+        username=interaction.user.display_name,
+        roll_value=roll_value,
+        role=role_value,
+        champion=picked
+    )
+
+    send_kwargs = {}
+    if picked:
         # Create embed
         embed = discord.Embed(
             title=f"🎲 Rolled {roll_value}!",
@@ -588,23 +929,15 @@ async def roll(interaction: discord.Interaction, role: app_commands.Choice[str]
         )
         
         # Add roll value with visual representation
-        roll_bar = "█" * (roll_value // 2) + "░" * (10 - roll_value // 2)
         embed.add_field(
             name="🎯 Roll Result",
-            value=f"**{roll_value}/20**\n`{roll_bar}`",
+            value=f"**{roll_value}/20**\n`{_ROLL_BARS[roll_value]}`",
             inline=True
         )
         
         # Add role information if specified
         if role_value:
-            role_emojis = {
-                "top": "🔝",
-                "jungle": "🌲",
-                "mid": "⚡",
-                "adc": "🏹",
-                "support": "🛡️"
-            }
-            role_emoji = role_emojis.get(role_value, "⚔️")
+            role_emoji = _ROLE_EMOJIS.get(role_value, "⚔️")
             embed.add_field(
                 name="🎭 Role",
                 value=f"{role_emoji} **{role_value.title()}**",
@@ -615,25 +948,10 @@ async def roll(interaction: discord.Interaction, role: app_commands.Choice[str]
         champion_info = get_champion_info(picked)
         if champion_info:
             aggression = champion_info['aggression']
-            aggression_percentage = (aggression / 20) * 100
-            
-            # Add aggression emoji
-            if aggression == 1:
-                aggression_emoji = "🛡️"
-            elif 2 <= aggression <= 4:
-                aggression_emoji = "🌱"
-            elif 5 <= aggression <= 9:
-                aggression_emoji = "⚖️"
-            elif 10 <= aggression <= 14:
-                aggression_emoji = "⚔️"
-            elif 15 <= aggression <= 19:
-                aggression_emoji = "🔥"
-            else:  # aggression == 20
-                aggression_emoji = "💥"
-            
+            aggression_emoji = _AGGR_EMOJI[aggression]
             embed.add_field(
                 name=f"{aggression_emoji} Aggression",
-                value=f"**{aggression}/20** ({aggression_percentage:.0f}%)",
+                value=f"**{aggression}/20** ({_AGGR_PCT_STR[aggression]})",
                 inline=True
             )
         
@@ -648,24 +966,11 @@ async def roll(interaction: discord.Interaction, role: app_commands.Choice[str]
         embed.set_footer(text=f"Rolled by {interaction.user.display_name}")
         
         # Try to attach the champion icon image if available
-        icon_path = get_icon_path_for_champion(picked)
-        if icon_path:
+        icon_file = _icon_file(champion_info['icon_file']) if champion_info else None
+        if icon_file is not None:
             embed.set_thumbnail(url="attachment://champion.png")
-            await interaction.response.send_message(embed=embed, file=discord.File(icon_path, filename="champion.png"))
-            return
-        else:
-            await interaction.response.send_message(embed=embed)
-            return
+            send_kwargs['file'] = icon_file
     else:
-        # Log the roll even if no champion found
-        log_roll(
-            user_id=interaction.user.id,
-            username=interaction.user.display_name,
-            roll_value=roll_value,
-            role=role_value,
-            champion=None
-        )
-        
         # Create embed for no champion found
         embed = discord.Embed(
             title=f"🎲 Rolled {roll_value}!",
@@ -680,14 +985,7 @@ async def roll(interaction: discord.Interaction, role: app_commands.Choice[str]
         )
         
         if role_value:
-            role_emojis = {
-                "top": "🔝",
-                "jungle": "🌲",
-                "mid": "⚡",
-                "adc": "🏹",
-                "support": "🛡️"
-            }
-            role_emoji = role_emojis.get(role_value, "⚔️")
+            role_emoji = _ROLE_EMOJIS.get(role_value, "⚔️")
             embed.add_field(
                 name="🎭 Role",
                 value=f"{role_emoji} **{role_value.title()}**",
@@ -701,14 +999,16 @@ async def roll(interaction: discord.Interaction, role: app_commands.Choice[str]
         )
         
         embed.set_footer(text=f"Rolled by {interaction.user.display_name}")
-        
-        await interaction.response.send_message(embed=embed)
+
+    await interaction.followup.send(embed=embed, **send_kwargs)
 
 
 @tree.command(name="stats", description="Show your roll statistics including total rolls, natural 20s, natural 1s, and recent rolls.")
 async def stats(interaction: discord.Interaction):
     """Show user's roll statistics."""
-    stats_data = get_user_stats(interaction.user.id)
+    # Acknowledge first so a slow database read can't miss Discord's 3-second window
+    await interaction.response.defer()
+    stats_data = await _run_read(get_user_stats, interaction.user.id)
     
     if stats_data['total_rolls'] == 0:
         embed = discord.Embed(
@@ -717,29 +1017,29 @@ async def stats(interaction: discord.Interaction):
             color=0x7289da
         )
         embed.set_thumbnail(url=interaction.user.display_avatar.url)
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
         return
     
     # Calculate percentages
     nat_20_percent = (stats_data['natural_20s'] / stats_data['total_rolls']) * 100 if stats_data['total_rolls'] > 0 else 0
     nat_1_percent = (stats_data['natural_1s'] / stats_data['total_rolls']) * 100 if stats_data['total_rolls'] > 0 else 0
     
-    # Determine embed color based on luck
+    # Luck tier picks both the embed color and the footer
     if nat_20_percent > 10:  # Very lucky
-        color = 0x00ff00  # Green
+        luck = 0
     elif nat_20_percent > 5:  # Lucky
-        color = 0xffff00  # Yellow
+        luck = 1
     elif nat_1_percent > 15:  # Unlucky
-        color = 0xff0000  # Red
+        luck = 2
     else:  # Average
-        color = 0x7289da  # Discord blue
+        luck = 3
     
     # Create embed
     embed = discord.Embed(
         title=f"🎲 Roll Statistics",
         description=f"**{interaction.user.display_name}**'s dice rolling performance",
-        color=color,
-        timestamp=datetime.now()
+        color=_STATS_COLORS[luck],
+        timestamp=datetime.now(timezone.utc)
     )
     
     # Set user avatar as thumbnail
@@ -754,10 +1054,19 @@ async def stats(interaction: discord.Interaction):
         inline=True
     )
     
-    # Calculate additional stats
-    avg_roll = sum(roll[0] for roll in stats_data['recent_rolls']) / len(stats_data['recent_rolls']) if stats_data['recent_rolls'] else 0
-    high_rolls = sum(1 for roll in stats_data['recent_rolls'] if roll[0] >= 15)
-    low_rolls = sum(1 for roll in stats_data['recent_rolls'] if roll[0] <= 5)
+    # One pass over the recent rolls: averages and counts over all of them, display lines for the newest 5
+    recent_rolls = stats_data['recent_rolls']
+    roll_sum = high_rolls = low_rolls = 0
+    lines = []
+    for i, (roll_value, role, champion, timestamp) in enumerate(recent_rolls):
+        roll_sum += roll_value
+        high_rolls += roll_value >= 15
+        low_rolls += roll_value <= 5
+        if i < 5:
+            role_str = f" ({role})" if role else ""
+            champion_str = f" → {champion}" if champion else ""
+            lines.append(f"{_RECENT_ROLL_EMOJI[roll_value]} **{roll_value}**{role_str}{champion_str}\n")
+    avg_roll = roll_sum / len(recent_rolls) if recent_rolls else 0
     
     embed.add_field(
         name="🎯 Recent Performance",
@@ -768,54 +1077,21 @@ async def stats(interaction: discord.Interaction):
     )
     
     # Add recent rolls as a field
-    if stats_data['recent_rolls']:
-        recent_text = ""
-        for i, roll in enumerate(stats_data['recent_rolls'][:5], 1):
-            roll_value, role, champion, timestamp = roll
-            role_str = f" ({role})" if role else ""
-            champion_str = f" → {champion}" if champion else ""
-            
-            # Add emoji based on roll value
-            if roll_value == 20:
-                emoji = "🎉"
-            elif roll_value == 1:
-                emoji = "💀"
-            elif roll_value >= 15:
-                emoji = "🔥"
-            elif roll_value <= 5:
-                emoji = "😞"
-            else:
-                emoji = "🎲"
-            
-            recent_text += f"{emoji} **{roll_value}**{role_str}{champion_str}\n"
-        
+    if lines:
         embed.add_field(
             name="📜 Recent Rolls",
-            value=recent_text,
+            value="".join(lines),
             inline=False
         )
     
     # Add footer with fun fact
-    if nat_20_percent > 10:
-        footer_text = "🎊 You're incredibly lucky!"
-    elif nat_20_percent > 5:
-        footer_text = "🍀 Lady luck is on your side!"
-    elif nat_1_percent > 15:
-        footer_text = "😅 Maybe try a different dice?"
-    else:
-        footer_text = "🎲 Keep rolling!"
+    embed.set_footer(text=_STATS_FOOTERS[luck])
     
-    embed.set_footer(text=footer_text)
-    
-    await interaction.response.send_message(embed=embed)
+    await interaction.followup.send(embed=embed)
 
 
-@tree.command(name="leaderboard", description="View leaderboards for various roll statistics.")
-@app_commands.describe(
-    category="Choose which leaderboard to view",
-    limit="Number of entries to show (1-25, default: 10)"
-)
-@app_commands.choices(category=[
+# Categories offered by /leaderboard and /lb, and the embed color for each.
+LEADERBOARD_CHOICES = [
     app_commands.Choice(name="🏆 Total Rolls", value="total_rolls"),
     app_commands.Choice(name="🎉 Natural 20s", value="natural_20s"),
     app_commands.Choice(name="💀 Natural 1s", value="natural_1s"),
@@ -824,100 +1100,86 @@ async def stats(interaction: discord.Interaction):
     app_commands.Choice(name="📊 Highest Average", value="highest_avg"),
     app_commands.Choice(name="📅 Most Active Today", value="most_active_today"),
     app_commands.Choice(name="📆 Most Active This Week", value="most_active_week"),
-])
-async def leaderboard(interaction: discord.Interaction, category: app_commands.Choice[str], limit: int = 10):
-    """Show leaderboard for various statistics."""
-    # Validate limit
-    if limit < 1 or limit > 25:
-        embed = discord.Embed(
-            title="❌ Invalid Limit",
-            description="Limit must be between 1 and 25.",
-            color=0xff0000
-        )
-        await interaction.response.send_message(embed=embed)
-        return
-    
-    # Get leaderboard data
-    leaderboard_data = get_leaderboard_data(category.value, limit)
+]
+LB_COLOR_MAP = {
+    "total_rolls": 0x7289da,      # Discord blue
+    "natural_20s": 0x00ff00,       # Green
+    "natural_1s": 0xff0000,        # Red
+    "luckiest": 0xffd700,          # Gold
+    "unluckiest": 0x808080,        # Gray
+    "highest_avg": 0x9932cc,       # Purple
+    "most_active_today": 0xff8c00, # Orange
+    "most_active_week": 0x00bfff   # Deep sky blue
+}
+
+# Footer explaining how each category is ranked; others get a generic one.
+LB_FOOTERS = {
+    "luckiest": "🍀 Based on natural 20 percentage (minimum 5 rolls)",
+    "unluckiest": "😅 Based on natural 1 percentage (minimum 5 rolls)",
+    "highest_avg": "📊 Based on average roll value (minimum 5 rolls)",
+    "most_active_today": "📅 Rolls made today",
+    "most_active_week": "📆 Rolls made in the last 7 days",
+}
+
+# Discord's limit on the length of a single embed field value.
+_EMBED_FIELD_MAX = 1024
+
+# Medal for the top three ranks; everyone else gets a bold number.
+_RANK_EMOJIS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+def _format_default(data: tuple) -> str:
+    """Fallback leaderboard formatter: the first data column as-is."""
+    return str(data[0])
+
+# Category -> formatter for a leaderboard row's data columns (see _LEADERBOARD_QUERIES).
+LB_FORMATTERS = {
+    "total_rolls": lambda d: f"{d[0]} rolls",
+    "natural_20s": lambda d: f"{d[0]} natural 20s",
+    "natural_1s": lambda d: f"{d[0]} natural 1s",
+    "luckiest": lambda d: f"{d[2]}% ({d[0]}/{d[1]})",
+    "unluckiest": lambda d: f"{d[2]}% ({d[0]}/{d[1]})",
+    "highest_avg": lambda d: f"{d[0]} avg ({d[1]} rolls)",
+    "most_active_today": lambda d: f"{d[0]} rolls",
+    "most_active_week": lambda d: f"{d[0]} rolls",
+}
+
+
+def _build_lb_embed(category_value: str, category_name: str, entries: List[Dict[str, Any]],
+                    user_rank: Optional[Dict[str, Any]], data_time: datetime) -> discord.Embed:
+    """Build the leaderboard embed from already-fetched rows; no Discord or database I/O."""
+    # Determine embed color based on category
+    color = LB_COLOR_MAP.get(category_value, 0x7289da)
     
-    if not leaderboard_data:
-        embed = discord.Embed(
-            title="📊 Leaderboard",
-            description=f"No data available for **{category.name}** yet.\n\nStart rolling to see leaderboards!",
-            color=0x808080
-        )
-        await interaction.response.send_message(embed=embed)
-        return
+    # Build leaderboard text
+    format_value = LB_FORMATTERS.get(category_value, _format_default)
+    lines = []
+    for entry in entries:
+        rank = entry['rank']
+        rank_emoji = _RANK_EMOJIS.get(rank) or f"**{rank}.**"
+        lines.append(f"{rank_emoji} **{entry['username']}** - {format_value(entry['data'])}")
+    leaderboard_text = "\n".join(lines)
+    shown = len(lines)
     
-    # Determine embed color based on category
-    color_map = {
-        "total_rolls": 0x7289da,      # Discord blue
-        "natural_20s": 0x00ff00,       # Green
-        "natural_1s": 0xff0000,        # Red
-        "luckiest": 0xffd700,          # Gold
-        "unluckiest": 0x808080,        # Gray
-        "highest_avg": 0x9932cc,       # Purple
-        "most_active_today": 0xff8c00, # Orange
-        "most_active_week": 0x00bfff   # Deep sky blue
-    }
-    color = color_map.get(category.value, 0x7289da)
+    # Discord rejects the whole embed if a field value is too long, so drop trailing rows instead
+    if len(leaderboard_text) > _EMBED_FIELD_MAX:
+        leaderboard_text = leaderboard_text[:_EMBED_FIELD_MAX - 2].rsplit("\n", 1)[0]
+        shown = leaderboard_text.count("\n") + 1
+        leaderboard_text += "\n…"
     
     # Create embed
     embed = discord.Embed(
-        title=f"🏆 {category.name} Leaderboard",
-        description=f"Top {len(leaderboard_data)} players",
+        title=f"🏆 {category_name} Leaderboard",
+        description=f"Top {shown} players",
         color=color,
-        timestamp=datetime.now()
+        timestamp=data_time
     )
     
-    # Build leaderboard text
-    leaderboard_text = ""
-    for entry in leaderboard_data:
-        rank = entry['rank']
-        username = entry['username']
-        data = entry['data']
-        
-        # Add rank emoji
-        if rank == 1:
-            rank_emoji = "🥇"
-        elif rank == 2:
-            rank_emoji = "🥈"
-        elif rank == 3:
-            rank_emoji = "🥉"
-        else:
-            rank_emoji = f"**{rank}.**"
-        
-        # Format data based on category
-        if category.value == "total_rolls":
-            value_text = f"{data[0]} rolls"
-        elif category.value == "natural_20s":
-            value_text = f"{data[0]} natural 20s"
-        elif category.value == "natural_1s":
-            value_text = f"{data[0]} natural 1s"
-        elif category.value == "luckiest":
-            nat_20s, total_rolls, luck_percentage = data
-            value_text = f"{luck_percentage}% ({nat_20s}/{total_rolls})"
-        elif category.value == "unluckiest":
-            nat_1s, total_rolls, unluck_percentage = data
-            value_text = f"{unluck_percentage}% ({nat_1s}/{total_rolls})"
-        elif category.value == "highest_avg":
-            avg_roll, total_rolls = data
-            value_text = f"{avg_roll} avg ({total_rolls} rolls)"
-        elif category.value in ["most_active_today", "most_active_week"]:
-            value_text = f"{data[0]} rolls"
-        else:
-            value_text = str(data[0])
-        
-        leaderboard_text += f"{rank_emoji} **{username}** - {value_text}\n"
-    
     embed.add_field(
         name="📊 Rankings",
         value=leaderboard_text,
         inline=False
     )
     
-    # Add user's rank if they have data
-    user_rank = get_user_rank(interaction.user.id, category.value)
     if user_rank:
         embed.add_field(
             name="🎯 Your Rank",
@@ -926,23 +1188,60 @@ async def leaderboard(interaction: discord.Interaction, category: app_commands.C
         )
     
     # Add footer with helpful info
-    footer_text = ""
-    if category.value == "luckiest":
-        footer_text = "🍀 Based on natural 20 percentage (minimum 5 rolls)"
-    elif category.value == "unluckiest":
-        footer_text = "😅 Based on natural 1 percentage (minimum 5 rolls)"
-    elif category.value == "highest_avg":
-        footer_text = "📊 Based on average roll value (minimum 5 rolls)"
-    elif category.value == "most_active_today":
-        footer_text = "📅 Rolls made today"
-    elif category.value == "most_active_week":
-        footer_text = "📆 Rolls made in the last 7 days"
+    embed.set_footer(text=LB_FOOTERS.get(category_value, "🎲 Keep rolling to climb the leaderboard!"))
+    return embed
+
+
+async def _render_leaderboard(interaction: discord.Interaction, category_value: str, category_name: str, limit: int):
+    """Build and send the leaderboard embed shared by /leaderboard and /lb."""
+    # Validate limit
+    if limit < 1 or limit > 25:
+        embed = discord.Embed(
+            title="❌ Invalid Limit",
+            description="Limit must be between 1 and 25.",
+            color=0xff0000
+        )
+        await interaction.response.send_message(embed=embed)
+        return
+    
+    # Acknowledge first so a cold leaderboard query can't miss Discord's 3-second window
+    await interaction.response.defer()
+    
+    # Get leaderboard data from the background snapshot; query directly until the first refresh has run,
+    # or when that refresh found no rolls yet, so the first rolls don't wait up to 5 minutes to show up
+    snapshot = LB_SNAPSHOT.get(category_value)
+    if snapshot:
+        leaderboard_data = snapshot[:limit]
+        data_time = LB_SNAPSHOT_TS[category_value]
     else:
-        footer_text = "🎲 Keep rolling to climb the leaderboard!"
+        leaderboard_data = await _run_read(get_leaderboard_data, category_value, limit)
+        data_time = datetime.now(timezone.utc)
     
-    embed.set_footer(text=footer_text)
+    if not leaderboard_data:
+        embed = discord.Embed(
+            title="📊 Leaderboard",
+            description=f"No data available for **{category_name}** yet.\n\nStart rolling to see leaderboards!",
+            color=0x808080
+        )
+        await interaction.followup.send(embed=embed)
+        return
     
-    await interaction.response.send_message(embed=embed)
+    # Add user's rank if they have data
+    user_rank = await _run_read(get_user_rank_cached, interaction.user.id, category_value)
+    
+    embed = _build_lb_embed(category_value, category_name, leaderboard_data, user_rank, data_time)
+    await interaction.followup.send(embed=embed)
+
+
+@tree.command(name="leaderboard", description="View leaderboards for various roll statistics.")
+@app_commands.describe(
+    category="Choose which leaderboard to view",
+    limit="Number of entries to show (1-25, default: 10)"
+)
+@app_commands.choices(category=LEADERBOARD_CHOICES)
+async def leaderboard(interaction: discord.Interaction, category: app_commands.Choice[str], limit: int = 10):
+    """Show leaderboard for various statistics."""
+    await _render_leaderboard(interaction, category.value, category.name, limit)
 
 
 @tree.command(name="lb", description="Quick access to leaderboards (alias for /leaderboard).")
@@ -950,43 +1249,22 @@ async def leaderboard(interaction: discord.Interaction, category: app_commands.C
     category="Choose which leaderboard to view",
     limit="Number of entries to show (1-25, default: 10)"
 )
-@app_commands.choices(category=[
-    app_commands.Choice(name="🏆 Total Rolls", value="total_rolls"),
-    app_commands.Choice(name="🎉 Natural 20s", value="natural_20s"),
-    app_commands.Choice(name="💀 Natural 1s", value="natural_1s"),
-    app_commands.Choice(name="🍀 Luckiest", value="luckiest"),
-    app_commands.Choice(name="😅 Unluckiest", value="unluckiest"),
-    app_commands.Choice(name="📊 Highest Average", value="highest_avg"),
-    app_commands.Choice(name="📅 Most Active Today", value="most_active_today"),
-    app_commands.Choice(name="📆 Most Active This Week", value="most_active_week"),
-])
+@app_commands.choices(category=LEADERBOARD_CHOICES)
 async def lb(interaction: discord.Interaction, category: app_commands.Choice[str], limit: int = 10):
     """Quick access to leaderboards."""
-    # Reuse the leaderboard logic
-    await leaderboard.callback(interaction, category, limit)
+    await _render_leaderboard(interaction, category.value, category.name, limit)
 
 
 @tree.command(name="champion", description="Get detailed information about a specific champion.")
 @app_commands.describe(champion_name="The name of the champion to look up")
 async def champion(interaction: discord.Interaction, champion_name: str):
     """Show detailed information about a champion."""
+    # Acknowledge first, like the other commands, so the reply is never cut off by Discord's 3-second window
+    await interaction.response.defer()
     champion_info = get_champion_info(champion_name)
     
     if not champion_info:
-        # Try to find similar champion names
-        all_champions = set()
-        all_champions.update(TOP_LANE_CHAMPIONS.keys())
-        all_champions.update(JUNGLE_CHAMPIONS.keys())
-        all_champions.update(ADC_CHAMPIONS.keys())
-        all_champions.update(MID_LANE_CHAMPIONS.keys())
-        all_champions.update(SUPPORT_CHAMPIONS.keys())
-        
-        # Find champions with similar names
-        similar = []
-        champion_lower = champion_name.lower()
-        for champ in all_champions:
-            if champion_lower in champ.lower() or champ.lower() in champion_lower:
-                similar.append(champ)
+        similar = find_similar_champions(champion_name)
         
         embed = discord.Embed(
             title="❌ Champion Not Found",
@@ -995,7 +1273,7 @@ async def champion(interaction: discord.Interaction, champion_name: str):
         )
         
         if similar:
-            similar_str = ", ".join(sorted(similar)[:5])  # Show up to 5 similar names
+            similar_str = ", ".join(similar)
             embed.add_field(
                 name="💡 Did you mean:",
                 value=similar_str,
@@ -1008,23 +1286,11 @@ async def champion(interaction: discord.Interaction, champion_name: str):
                 inline=False
             )
         
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
         return
     
-    # Determine embed color based on aggression level
     aggression = champion_info['aggression']
-    if aggression == 1:
-        color = 0x808080  # Gray - passive
-    elif 2 <= aggression <= 4:
-        color = 0x87ceeb  # Light blue - very passive
-    elif 5 <= aggression <= 9:
-        color = 0xffff00  # Yellow - moderate
-    elif 10 <= aggression <= 14:
-        color = 0xff8c00  # Orange - aggressive
-    elif 15 <= aggression <= 19:
-        color = 0xff4500  # Red-orange - very aggressive
-    else:  # aggression == 20
-        color = 0xff0000  # Red - ultra aggressive
+    color, tier, tier_desc, playstyle_desc, matchup_info, phase_info, footer_text = _CHAMPION_AGGR_INFO[aggression]
     
     # Create embed with enhanced title and description
     embed = discord.Embed(
@@ -1034,67 +1300,21 @@ async def champion(interaction: discord.Interaction, champion_name: str):
     )
     
     # Add aggression level with enhanced visual bar and percentage
-    aggression_percentage = (aggression / 20) * 100
-    aggression_bar = "█" * (aggression // 2) + "░" * (10 - aggression // 2)
-    
-    # Add aggression emoji based on level
-    if aggression == 1:
-        aggression_emoji = "🛡️"
-    elif 2 <= aggression <= 4:
-        aggression_emoji = "🌱"
-    elif 5 <= aggression <= 9:
-        aggression_emoji = "⚖️"
-    elif 10 <= aggression <= 14:
-        aggression_emoji = "⚔️"
-    elif 15 <= aggression <= 19:
-        aggression_emoji = "🔥"
-    else:  # aggression == 20
-        aggression_emoji = "💥"
-    
+    aggression_emoji = _AGGR_EMOJI[aggression]
     embed.add_field(
         name=f"{aggression_emoji} Aggression Level",
-        value=f"**{aggression}/20** ({aggression_percentage:.0f}%)\n`{aggression_bar}`",
+        value=f"**{aggression}/20** ({_AGGR_PCT_STR[aggression]})\n`{_ROLL_BARS[aggression]}`",
         inline=True
     )
     
     # Add roles with enhanced emojis and formatting
-    role_emojis = {
-        "Top": "🔝",
-        "Jungle": "🌲", 
-        "Mid": "⚡",
-        "ADC": "🏹",
-        "Support": "🛡️"
-    }
-    
-    # Create role badges
-    role_badges = []
-    for role in champion_info['roles']:
-        emoji = role_emojis.get(role, '⚔️')
-        role_badges.append(f"{emoji} **{role}**")
-    
     embed.add_field(
         name="🎭 Primary Roles",
-        value="\n".join(role_badges),
+        value=champion_info['role_badges_str'],
         inline=True
     )
     
     # Add champion tier/rarity based on aggression
-    if aggression >= 18:
-        tier = "🏆 **Legendary**"
-        tier_desc = "Extremely rare and powerful"
-    elif aggression >= 15:
-        tier = "💎 **Epic**"
-        tier_desc = "High-tier champion"
-    elif aggression >= 10:
-        tier = "⭐ **Rare**"
-        tier_desc = "Above average champion"
-    elif aggression >= 5:
-        tier = "🔸 **Common**"
-        tier_desc = "Standard champion"
-    else:
-        tier = "🔹 **Basic**"
-        tier_desc = "Entry-level champion"
-    
     embed.add_field(
         name="🏅 Champion Tier",
         value=f"{tier}\n*{tier_desc}*",
@@ -1102,56 +1322,6 @@ async def champion(interaction: discord.Interaction, champion_name: str):
     )
     
     # Add detailed playstyle description with enhanced formatting
-    playstyle_desc = ""
-    if aggression == 1:
-        playstyle_desc = (
-            "🛡️ **Ultra Passive Playstyle**\n"
-            "• Avoid all fights and skirmishes\n"
-            "• Focus on farming and scaling\n"
-            "• Play defensively at all times\n"
-            "• Perfect for patient players"
-        )
-    elif 2 <= aggression <= 4:
-        playstyle_desc = (
-            "🌱 **Very Passive Playstyle**\n"
-            "• Farm safely and avoid unnecessary fights\n"
-            "• Only engage when you have clear advantages\n"
-            "• Focus on late-game scaling\n"
-            "• Great for defensive players"
-        )
-    elif 5 <= aggression <= 9:
-        playstyle_desc = (
-            "⚖️ **Balanced Playstyle**\n"
-            "• Participate in light skirmishes\n"
-            "• Look for safe opportunities\n"
-            "• Adapt to game state\n"
-            "• Versatile for all players"
-        )
-    elif 10 <= aggression <= 14:
-        playstyle_desc = (
-            "⚔️ **Aggressive Playstyle**\n"
-            "• Look for opportunities to make plays\n"
-            "• Control the pace of the game\n"
-            "• Take calculated risks\n"
-            "• Perfect for proactive players"
-        )
-    elif 15 <= aggression <= 19:
-        playstyle_desc = (
-            "🔥 **Very Aggressive Playstyle**\n"
-            "• Be the primary engage for teamfights\n"
-            "• Dictate when fights happen\n"
-            "• Create pressure and opportunities\n"
-            "• Ideal for aggressive players"
-        )
-    else:  # aggression == 20
-        playstyle_desc = (
-            "💥 **Ultra Aggressive Playstyle**\n"
-            "• Dictate when fights happen\n"
-            "• Control the entire game flow\n"
-            "• Maximum pressure and aggression\n"
-            "• For fearless players only!"
-        )
-    
     embed.add_field(
         name="📋 Playstyle Guide",
         value=playstyle_desc,
@@ -1159,14 +1329,6 @@ async def champion(interaction: discord.Interaction, champion_name: str):
     )
     
     # Add matchup information
-    matchup_info = ""
-    if aggression >= 15:
-        matchup_info = "🔥 **Counters:** Passive champions\n🛡️ **Weak to:** Disengage champions"
-    elif aggression <= 5:
-        matchup_info = "🛡️ **Counters:** Aggressive champions\n⚔️ **Weak to:** Early game champions"
-    else:
-        matchup_info = "⚖️ **Counters:** Extreme playstyles\n🎯 **Weak to:** Specialized champions"
-    
     embed.add_field(
         name="⚔️ Matchup Info",
         value=matchup_info,
@@ -1174,13 +1336,6 @@ async def champion(interaction: discord.Interaction, champion_name: str):
     )
     
     # Add recommended game phase
-    if aggression >= 15:
-        phase_info = "🌅 **Early Game**\n• Strong laning phase\n• Look for early kills\n• Control objectives"
-    elif aggression <= 5:
-        phase_info = "🌙 **Late Game**\n• Focus on farming\n• Scale into late game\n• Teamfight oriented"
-    else:
-        phase_info = "🌞 **Mid Game**\n• Balanced approach\n• Adapt to game state\n• Flexible timing"
-    
     embed.add_field(
         name="⏰ Best Phase",
         value=phase_info,
@@ -1188,34 +1343,59 @@ async def champion(interaction: discord.Interaction, champion_name: str):
     )
     
     # Add footer with enhanced message and champion count
-    total_champions = len(set().union(TOP_LANE_CHAMPIONS.keys(), JUNGLE_CHAMPIONS.keys(), 
-                                     ADC_CHAMPIONS.keys(), MID_LANE_CHAMPIONS.keys(), 
-                                     SUPPORT_CHAMPIONS.keys()))
-    
-    if aggression >= 15:
-        footer_text = f"🔥 Perfect for aggressive players! • {total_champions} champions available"
-    elif aggression <= 5:
-        footer_text = f"🛡️ Great for defensive players! • {total_champions} champions available"
-    else:
-        footer_text = f"⚖️ Balanced for all playstyles! • {total_champions} champions available"
-    
     embed.set_footer(text=footer_text)
     
     # Try to attach the champion icon image if available
-    if champion_info['icon_path']:
+    icon_file = _icon_file(champion_info['icon_file'])
+    if icon_file is not None:
         embed.set_thumbnail(url="attachment://champion.png")
-        await interaction.response.send_message(embed=embed, file=discord.File(champion_info['icon_path'], filename="champion.png"))
+        await interaction.followup.send(embed=embed, file=icon_file)
     else:
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
+
+
+def _commands_hash() -> str:
+    """Return a stable hash of the application commands as they would be sent to Discord."""
+    payload = {
+        'application_id': client.application_id,
+        'commands': sorted((cmd.to_dict(tree) for cmd in tree.get_commands()), key=lambda c: c['name']),
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+async def sync_commands_if_changed() -> bool:
+    """Sync slash commands only when their definitions changed since the last sync. Returns True if synced."""
+    try:
+        digest = _commands_hash()
+    except TypeError:
+        # Command.to_dict() only accepts the tree from discord.py 2.4 on; without a hash, always sync
+        await tree.sync()
+        return True
+    try:
+        with open(COMMANDS_HASH_PATH, 'r', encoding='utf-8') as f:
+            if f.read().strip() == digest:
+                return False
+    except OSError:
+        pass
+
+    await tree.sync()
+    try:
+        with open(COMMANDS_HASH_PATH, 'w', encoding='utf-8') as f:
+            f.write(digest)
+    except OSError as e:
+        # The sync itself succeeded; without the saved hash the next startup just syncs again
+        print("WARNING: Could not save the command hash cache:", e, file=sys.stderr)
+    return True
 
 
 @client.event
 async def on_ready():
     try:
-        # Initialize database
-        init_database()
-        await tree.sync()
-        print(f"Logged in as {client.user} (id={client.user.id}) | Slash commands synced")
+        if await sync_commands_if_changed():
+            print(f"Logged in as {client.user} (id={client.user.id}) | Slash commands synced")
+        else:
+            print(f"Logged in as {client.user} (id={client.user.id}) | Slash commands unchanged, sync skipped")
     except Exception as e:
         print(f"Logged in as {client.user} (id={client.user.id})")
         print("WARNING: Failed to sync application commands:", e, file=sys.stderr)